@@ -5,44 +5,237 @@ import getpass
 import json
 import os
 import re
+import threading
 import time
 import unicodedata
+import urllib.parse
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from uuid import uuid4
 
 import requests
+from diskcache import Cache
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+# orjson is optional; it parses API responses considerably faster
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 CONFIG_PATH = os.path.expanduser("~/.config/onshape-exporter.json")
+CACHE_PATH = os.path.expanduser("~/.cache/onshape-exporter")
 BASE_URL = "https://cad.onshape.com"
 
+# Metadata of document versions (element names, configurations) can't change,
+# so it's kept on disk for CACHE_EXPIRE seconds. Workspaces can be edited at
+# any time, so their metadata is instead revalidated with ETags on every run.
+CACHE_EXPIRE = 3600
+# ETag-validated response bodies can be kept much longer, since they're
+# revalidated with the server on every use
+ETAG_CACHE_EXPIRE = 30 * 24 * 3600
+
 HEADERS = {
     "Accept": "application/vnd.onshape.v1+json",
     "Content-Type": "application/json",
 }
 
+_URL_RE = re.compile(r"/documents/([^/]+)/([wv])/([^/]+)/e/([^/?#]+)")
+_CFG_RE = re.compile(r"configuration=([^&]+)")
+# Deletes every ASCII character other than word characters, whitespace and "-"
+_SLUG_TABLE = str.maketrans(
+    {
+        c: None
+        for c in map(chr, range(128))
+        if not (c.isalnum() or c.isspace() or c in "-_")
+    }
+)
+_SLUG_DASH = re.compile(r"[-\s]+")
+
+# Headers for the asynchronous translation API
+ASYNC_HEADERS = {
+    **HEADERS,
+    "Accept": "application/json;charset=UTF-8; qs=0.09",
+    "Content-Type": "application/json;charset=UTF-8; qs=0.09",
+}
+
+# Headers for downloading exported files
+DOWNLOAD_HEADERS = {
+    "Accept": "application/octet-stream",
+}
+
+# Translation status polling: exponential backoff from POLL_BASE_DELAY up to
+# POLL_MAX_DELAY seconds between checks, giving up after POLL_TIMEOUT seconds
+POLL_BASE_DELAY = 0.25
+POLL_BACKOFF_FACTOR = 1.6
+POLL_MAX_DELAY = 4.0
+POLL_TIMEOUT = 120
+
+# Exports run on worker threads, so output goes through a lock to keep
+# messages from different exports from interleaving mid-line
+PRINT_LOCK = threading.Lock()
+
+
+def log(*args, **kwargs):
+    with PRINT_LOCK:
+        print(*args, **kwargs)
+
+
+# The disk cache is opened on first use rather than at import
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = Cache(CACHE_PATH)
+        return _cache
+
+
+def _log_request(method, url, kwargs):
+    lines = [f"\n[{method}] {url}"]
+    if "headers" in kwargs:
+        lines.append(" Headers: " + json.dumps(kwargs["headers"], indent=2))
+    if "json" in kwargs:
+        lines.append(" JSON: " + json.dumps(kwargs["json"], indent=2))
+    if "data" in kwargs:
+        lines.append(f" Data: {kwargs['data']}")
+    if "params" in kwargs:
+        lines.append(f" Params: {kwargs['params']}")
+    log("\n".join(lines))
+
+
+def _log_response(r):
+    # Don't touch r.content here, it would defeat streamed downloads
+    length = r.headers.get("Content-Length", "?")
+    log(f" [HTTP {r.status_code}] -> {length} bytes")
+
 
 def verbose_request(method, url, **kwargs):
     verbose = kwargs.pop("verbose", False)
     if verbose:
-        print(f"\n[{method}] {url}")
-        if "headers" in kwargs:
-            print(" Headers:", json.dumps(kwargs["headers"], indent=2))
-        if "json" in kwargs:
-            print(" JSON:", json.dumps(kwargs["json"], indent=2))
-        if "data" in kwargs:
-            print(" Data:", kwargs["data"])
-        if "params" in kwargs:
-            print(" Params:", kwargs["params"])
-    r = requests.request(method, url, **kwargs)
+        _log_request(method, url, kwargs)
+    r = SESSION.request(method, url, **kwargs)
     if verbose:
-        print(f" [HTTP {r.status_code}] -> {len(r.content)} bytes received")
+        _log_response(r)
     return r
 
+
+def conditional_get(url, verbose=False, **kwargs):
+    """GET a URL, revalidating any previously fetched body with its ETag.
+
+    Returns (status_code, content). A 304 Not Modified is reported as a 200
+    with the cached content, so callers don't need to special-case it.
+    """
+    cache_key = ("etag", url)
+    cached = get_cache().get(cache_key)
+
+    headers = dict(kwargs.pop("headers", None) or {})
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    r = verbose_request("GET", url, headers=headers, verbose=verbose, **kwargs)
+    if r.status_code == 304 and cached:
+        return 200, cached[1]
+    if r.status_code == 200 and r.headers.get("ETag"):
+        get_cache().set(
+            cache_key, (r.headers["ETag"], r.content), expire=ETAG_CACHE_EXPIRE
+        )
+    return r.status_code, r.content
+
+
+def save_response(r, filename, chunk_size=1 << 20):
+    """Write a (streamed) response body to filename a chunk at a time.
+
+    The body goes to a uniquely named temporary ".part" file that's only
+    renamed into place once complete, so an interrupted download never leaves
+    a truncated file under the final name, and concurrent exports that map to
+    the same filename can't write into each other's temporary file.
+    """
+    tmp = f"{filename}.{uuid4().hex}.part"
+    # O_EXCL guarantees the file is ours; mode 0o666 lets the umask apply
+    # just as it would for open()
+    fd = os.open(tmp, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in r.iter_content(chunk_size=chunk_size):
+                f.write(chunk)
+        os.replace(tmp, filename)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def retry_after_seconds(r):
+    """Return the Retry-After delay of a response in seconds, or None.
+
+    The delay is never shorter than POLL_BASE_DELAY, so a server sending
+    "Retry-After: 0" can't make us poll back-to-back.
+    """
+    try:
+        return max(POLL_BASE_DELAY, float(r.headers["Retry-After"]))
+    except (KeyError, TypeError, ValueError):
+        # Missing, or an HTTP-date we don't bother parsing
+        return None
+
+
+# The same part studio and configuration names are slugified for every
+# exported format, so remember the results
+@lru_cache(maxsize=1024)
 def slugify(value, allow_unicode=False):
     value = str(value)
-    value = (
-        unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
-    )
-    value = re.sub(r"[^\w\s-]", "", value.lower())
-    return re.sub(r"[-\s]+", "-", value).strip("-_")
+    # Most names are already plain ASCII, which NFKD would leave untouched
+    if not value.isascii():
+        value = (
+            unicodedata.normalize("NFKD", value)
+            .encode("ascii", "ignore")
+            .decode("ascii")
+        )
+    value = value.lower().translate(_SLUG_TABLE)
+    return _SLUG_DASH.sub("-", value).strip("-_")
+
+
+def output_filename(output_dir, part_studio_name, config_display_name, ext, index=""):
+    """Build the path an export is saved to.
+
+    Files are named after the part studio and configuration, e.g.
+    "bracket-long.stl", with index distinguishing multiple result files.
+    """
+    names = []
+    if part_studio_name:
+        names.append(part_studio_name)
+        if config_display_name and config_display_name != "Default":
+            names.append(config_display_name)
+    else:
+        # Fall back to old naming scheme if part studio name not available
+        names.append(config_display_name)
+
+    name = "-".join(slugify(n) for n in names)
+    return os.path.join(output_dir, f"{name}{index}.{ext}")
+
+
+def output_exists(filename):
+    """Check whether a previous run already saved a non-empty filename."""
+    return os.path.exists(filename) and os.path.getsize(filename) > 0
+
+
+def existing_output(output_dir, part_studio_name, config_display_name, ext):
+    """Return the path of an earlier export of this configuration, or None.
+
+    Translations that produce several files save them with a _N suffix, so
+    the first of those counts too.
+    """
+    for index in ("", "_1"):
+        filename = output_filename(
+            output_dir, part_studio_name, config_display_name, ext, index=index
+        )
+        if output_exists(filename):
+            return filename
+    return None
 
 
 def load_credentials():
@@ -59,7 +252,37 @@ def load_credentials():
         return access_key, secret_key
 
 
-ACCESS_KEY, SECRET_KEY = load_credentials()
+# Shared session so every API call reuses pooled keep-alive connections.
+# Transient failures (rate limiting, 5xx, dropped connections) are retried
+# with exponential backoff by the adapter; once retries are exhausted the
+# last response is returned so callers can report the status code.
+# POSTs are only retried when the connection couldn't be established: the
+# translation POST isn't idempotent, and retrying it after the server may
+# have already accepted it would queue duplicate translation jobs.
+# Credentials are attached in main(), so importing this module doesn't read
+# or prompt for them.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_retry = Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods={"GET"},
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+
+def mount_adapter(session, pool_maxsize):
+    """Mount a retrying adapter keeping up to pool_maxsize connections per host."""
+    adapter = HTTPAdapter(
+        pool_connections=10, pool_maxsize=pool_maxsize, max_retries=_retry
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+mount_adapter(SESSION, 20)
 
 
 def get_version_id_from_name(did, version_name, verbose=False):
@@ -80,14 +303,10 @@ def get_version_id_from_name(did, version_name, verbose=False):
     path = f"/api/v6/documents/d/{did}/versions"
     url = f"{BASE_URL}{path}"
 
-    headers = HEADERS.copy()
-
     try:
-        r = verbose_request(
-            "GET", url, headers=headers, auth=(ACCESS_KEY, SECRET_KEY), verbose=verbose
-        )
+        r = verbose_request("GET", url, verbose=verbose)
         if r.status_code == 200:
-            versions = r.json()
+            versions = json_loads(r.content)
             # Search for matching version name
             for version in versions:
                 # Version names in API might be "v2.4.5" or just "2.4.5"
@@ -117,7 +336,7 @@ def parse_url(url, version_name=None):
     Returns: (did, wvm_id, eid, wvm_type)
     Where wvm_type is 'w' for workspace or 'v' for version.
     """
-    match = re.search(r"/documents/([^/]+)/([wv])/([^/]+)/e/([^/?#]+)", url)
+    match = _URL_RE.search(url)
     if not match:
         raise ValueError("Invalid Onshape URL format")
 
@@ -139,57 +358,50 @@ def parse_url(url, version_name=None):
 def get_part_studio_name(did, wvm_id, eid, wvm_type="w", verbose=False):
     """Get the name of the part studio element.
 
-    Tries multiple API endpoints to retrieve the part studio name.
+    The name comes from the document's element list, falling back to the
+    part studio metadata endpoint only if the element isn't found there.
     """
-    # Try using the document elements endpoint
-    path = f"/api/v6/documents/d/{did}/{wvm_type}/{wvm_id}/elements"
+    element_names = get_element_names(did, wvm_id, wvm_type, verbose=verbose)
+    if element_names and eid in element_names:
+        return element_names[eid] or "part"
+
+    # Try the part studio metadata endpoint
+    path = f"/api/v6/partstudios/d/{did}/{wvm_type}/{wvm_id}/e/{eid}/metadata"
     url = f"{BASE_URL}{path}"
 
-    headers = HEADERS.copy()
+    status, content = conditional_get(url, verbose=verbose)
+    if status == 200:
+        metadata = json_loads(content)
+        return metadata.get("name") or "part"
 
-    try:
-        r = verbose_request(
-            "GET", url, headers=headers, auth=(ACCESS_KEY, SECRET_KEY), verbose=verbose
-        )
-        if r.status_code == 200:
-            elements = r.json()
-            for element in elements:
-                if element.get("id") == eid:
-                    return element.get("name", "part")
-    except Exception as e:
-        print(f"⚠️ First attempt to get part studio name failed: {e}")
+    log("⚠️ Could not retrieve part studio name, using default")
+    return "part"
 
-    # Try the part studio metadata endpoint
-    try:
-        path = f"/api/v6/partstudios/d/{did}/{wvm_type}/{wvm_id}/e/{eid}/metadata"
-        url = f"{BASE_URL}{path}"
 
-        r = verbose_request(
-            "GET", url, headers=headers, auth=(ACCESS_KEY, SECRET_KEY), verbose=verbose
-        )
-        if r.status_code == 200:
-            metadata = r.json()
-            return metadata.get("name", "part")
-    except Exception as e:
-        print(f"⚠️ Second attempt to get part studio name failed: {e}")
+def get_element_names(did, wvm_id, wvm_type="w", verbose=False):
+    """Get a {element id: name} map for every element in the document.
 
-    # Try the configuration API as it might contain element metadata
-    try:
-        path = f"/api/v6/elements/d/{did}/{wvm_type}/{wvm_id}/e/{eid}/configuration"
-        url = f"{BASE_URL}{path}"
+    For versions the map is cached on disk, so looking up several elements
+    of the same version costs a single request. Returns None if the request
+    failed.
+    """
+    cache_key = ("element_names", did, wvm_type, wvm_id)
+    cacheable = wvm_type == "v"
+    element_names = get_cache().get(cache_key) if cacheable else None
+    if element_names is not None:
+        return element_names
 
-        r = verbose_request(
-            "GET", url, headers=headers, auth=(ACCESS_KEY, SECRET_KEY), verbose=verbose
-        )
-        if r.status_code == 200:
-            config_data = r.json()
-            if "elementName" in config_data:
-                return config_data.get("elementName")
-    except Exception:
-        pass
+    path = f"/api/v6/documents/d/{did}/{wvm_type}/{wvm_id}/elements"
+    url = f"{BASE_URL}{path}"
 
-    print("⚠️ Could not retrieve part studio name, using default")
-    return "part"
+    status, content = conditional_get(url, verbose=verbose)
+    if status != 200:
+        return None
+
+    element_names = {e.get("id"): e.get("name") for e in json_loads(content)}
+    if cacheable:
+        get_cache().set(cache_key, element_names, expire=CACHE_EXPIRE)
+    return element_names
 
 
 def get_configurations(did, wvm_id, eid, wvm_type="w", verbose=False):
@@ -197,94 +409,112 @@ def get_configurations(did, wvm_id, eid, wvm_type="w", verbose=False):
 
     This function:
     1. Gets the configuration data using getConfiguration API
-    2. Encodes each configuration option using encodeConfigurationMap API
-    3. Returns a list of configuration objects with query parameters and display names
+    2. Returns a list of configuration objects with display names
+
+    Options aren't encoded up front, since their exports may be skipped.
+    Instead of "configurationParametersQuery" they carry an "encode" callable
+    that encodes them on demand (see encode_configuration), along with the
+    (parameterId, option) "key" it encodes. For versions the option list is
+    cached on disk.
     """
-    # First, get the configuration data
-    path = f"/api/v6/elements/d/{did}/{wvm_type}/{wvm_id}/e/{eid}/configuration"
-    url = f"{BASE_URL}{path}"
+    cache_key = ("configuration_options", did, wvm_type, wvm_id, eid)
+    cacheable = wvm_type == "v"
+    options = get_cache().get(cache_key) if cacheable else None
 
-    headers = HEADERS.copy()
+    if options is None:
+        # First, get the configuration data
+        path = f"/api/v6/elements/d/{did}/{wvm_type}/{wvm_id}/e/{eid}/configuration"
+        url = f"{BASE_URL}{path}"
 
-    r = verbose_request(
-        "GET", url, headers=headers, auth=(ACCESS_KEY, SECRET_KEY), verbose=verbose
-    )
-    if r.status_code != 200:
-        print(f"Failed to get configurations: {r.status_code} {r.text}")
-        return []
+        status, content = conditional_get(url, verbose=verbose)
+        if status != 200:
+            text = content.decode(errors="replace")
+            log(f"Failed to get configurations: {status} {text}")
+            return []
 
-    config_data = r.json()
-    # print(json.dumps(config_data, indent=2))
+        config_data = json_loads(content)
+        # print(json.dumps(config_data, indent=2))
 
-    # Extract all configuration parameters
-    config_params = config_data.get("configurationParameters", [])
-    if not config_params:
-        # No configurations found
-        return [{"configurationParametersQuery": "", "configurationDisplay": "Default"}]
+        # Extract all configuration parameters
+        config_params = config_data.get("configurationParameters", [])
 
-    result = []
+        # Check if there's only one configuration parameter for simplified naming
+        num_params = len(config_params)
 
-    # Add the default configuration
-    result.append(
-        {"configurationParametersQuery": "", "configurationDisplay": "Default"}
-    )
+        options = []
+        for config_param in config_params:
+            param_id = config_param.get("parameterId")
+            param_name = config_param.get("parameterName")
+
+            for option in config_param.get("options", []):
+                option_name = option.get("optionName")
+
+                # Simplify name if there's only one parameter
+                if num_params == 1:
+                    display_name = option_name
+                else:
+                    display_name = f"{param_name} - {option_name}"
+
+                options.append((param_id, option.get("option"), display_name))
+
+        if cacheable:
+            get_cache().set(cache_key, options, expire=CACHE_EXPIRE)
 
-    # Check if there's only one configuration parameter for simplified naming
-    num_params = len(config_params)
-
-    # Process each configuration parameter
-    for config_param in config_params:
-        param_id = config_param.get("parameterId")
-        param_name = config_param.get("parameterName")
-        options = config_param.get("options", [])
-
-        for option in options:
-            option_value = option.get("option")
-            option_name = option.get("optionName")
-
-            # Skip the default option since we've already added it
-            # Create parameter map for encoding
-            param_map = {
-                "parameters": [
-                    {"parameterId": param_id, "parameterValue": option_value}
-                ]
+    # Add the default configuration
+    result = [{"configurationParametersQuery": "", "configurationDisplay": "Default"}]
+
+    for param_id, option_value, display_name in options:
+        result.append(
+            {
+                "configurationDisplay": display_name,
+                "key": (param_id, option_value),
+                "encode": partial(
+                    encode_configuration,
+                    did,
+                    eid,
+                    param_id,
+                    option_value,
+                    verbose=verbose,
+                ),
             }
+        )
 
-            # Encode the configuration
-            encode_path = f"/api/v6/elements/d/{did}/e/{eid}/configurationencodings"
-            encode_url = f"{BASE_URL}{encode_path}"
+    return result
 
-            r = verbose_request(
-                "POST",
-                encode_url,
-                headers=headers,
-                json=param_map,
-                auth=(ACCESS_KEY, SECRET_KEY),
-                verbose=verbose,
-            )
-            if r.status_code != 200:
-                print(
-                    f"Failed to encode configuration {option_name}: {r.status_code} {r.text}"
-                )
-                continue
 
-            encoding_data = r.json()
-            query_param = encoding_data.get("queryParam", "")
+def encode_configuration(did, eid, param_id, option_value, verbose=False):
+    """Encode a single configuration parameter value into a query string.
 
-            # Add to results - simplify name if there's only one parameter
-            if num_params == 1:
-                display_name = option_name
-            else:
-                display_name = f"{param_name} - {option_name}"
+    Returns the encoded queryParam, or None if encoding failed. Successful
+    encodings are cached on disk.
+    """
+    cache_key = ("configuration_encoding", did, eid, param_id, option_value)
+    query_param = get_cache().get(cache_key)
+    if query_param is not None:
+        return query_param
+
+    # Create parameter map for encoding
+    param_map = {
+        "parameters": [{"parameterId": param_id, "parameterValue": option_value}]
+    }
 
-            result.append(
-                {
-                    "configurationParametersQuery": query_param,
-                    "configurationDisplay": display_name,
-                }
-            )
+    encode_path = f"/api/v6/elements/d/{did}/e/{eid}/configurationencodings"
+    encode_url = f"{BASE_URL}{encode_path}"
 
-    return result
+    r = verbose_request(
+        "POST",
+        encode_url,
+        json=param_map,
+        verbose=verbose,
+    )
+    if r.status_code != 200:
+        log(f"Failed to encode {param_id}={option_value}: {r.status_code} {r.text}")
+        return None
+
+    encoding_data = json_loads(r.content)
+    query_param = encoding_data.get("queryParam", "")
+    get_cache().set(cache_key, query_param, expire=CACHE_EXPIRE)
+    return query_param
 
 
 def export_stl_sync(
@@ -304,15 +534,11 @@ def export_stl_sync(
 
     configuration = None
     if config_query_str:
-        config_match = re.search(r"configuration=([^&]+)", config_query_str)
+        config_match = _CFG_RE.search(config_query_str)
         if config_match:
             configuration = config_match.group(1)
 
-    print(
-        f"Exporting {format_upper} (sync) for {part_studio_name} {config_display_name}",
-        end="",
-        flush=True,
-    )
+    log(f"Exporting {format_upper} (sync) for {part_studio_name} {config_display_name}")
 
     path = f"/api/v6/partstudios/d/{did}/{wvm_type}/{wvm_id}/e/{eid}/stl"
     url = f"{BASE_URL}{path}"
@@ -322,7 +548,7 @@ def export_stl_sync(
     }
     res = (resolution or "fine").lower()
     if res not in ("coarse", "medium", "fine", "veryfine"):
-        print(f"Warning: Invalid STL resolution '{res}', defaulting to 'fine'")
+        log(f"Warning: Invalid STL resolution '{res}', defaulting to 'fine'")
         res = "fine"
 
     # presets = {
@@ -362,7 +588,6 @@ def export_stl_sync(
 
     if configuration:
         try:
-            import urllib.parse
             decoded_config = urllib.parse.unquote(configuration)
             params["configuration"] = decoded_config
         except Exception:
@@ -372,46 +597,32 @@ def export_stl_sync(
     r = verbose_request(
         "GET",
         url,
-        headers={"Accept": "application/octet-stream"},
+        headers=DOWNLOAD_HEADERS,
         params=params,
-        auth=(ACCESS_KEY, SECRET_KEY),
         allow_redirects=False,
+        stream=True,
         verbose=verbose,
     )
 
     if r.status_code in (302, 303, 307, 308) and "Location" in r.headers:
         redirect_url = r.headers["Location"]
+        r.close()
         r = verbose_request(
             "GET",
             redirect_url,
-            headers={"Accept": "application/octet-stream"},
-            auth=(ACCESS_KEY, SECRET_KEY),
+            headers=DOWNLOAD_HEADERS,
+            stream=True,
             verbose=verbose,
         )
 
     if r.status_code != 200:
-        print(
-            f"\n❌ Failed STL sync export: {r.status_code}\n{r.text}..."
-            if hasattr(r, "text")
-            else f"\n❌ Failed STL sync export: {r.status_code}"
-        )
+        error = f"❌ Failed STL sync export for {config_display_name}: {r.status_code}"
+        log(f"{error}\n{r.text}..." if hasattr(r, "text") else error)
         return
 
-    # Save the file using the same naming convention
-    names = []
-    if part_studio_name:
-        names.append(part_studio_name)
-        if config_display_name and config_display_name != "Default":
-            names.append(config_display_name)
-    else:
-        names.append(config_display_name)
-
-    name = "-".join(slugify(n) for n in names)
-    filename = os.path.join(output_dir, f"{name}.stl")
-
-    with open(filename, "wb") as f:
-        f.write(r.content)
-    print(f"\n✅ Saved {filename}")
+    filename = output_filename(output_dir, part_studio_name, config_display_name, "stl")
+    save_response(r, filename)
+    log(f"✅ Saved {filename}")
 
 
 def export_file(
@@ -433,28 +644,21 @@ def export_file(
     This approach works with all formats including STEP, IGES, STL, etc.
     """
     format_upper = format_.upper()
+    ext = format_upper.lower()
 
     # Extract configuration from query string if provided
     configuration = None
     if config_query_str:
-        config_match = re.search(r"configuration=([^&]+)", config_query_str)
+        config_match = _CFG_RE.search(config_query_str)
         if config_match:
             configuration = config_match.group(1)
 
-    print(
-        f"Exporting {format_upper} for {part_studio_name} {config_display_name}",
-        end="",
-        flush=True,
-    )
+    log(f"Exporting {format_upper} for {part_studio_name} {config_display_name}")
 
     # 1. Create the translation job
     path = f"/api/v6/partstudios/d/{did}/{wvm_type}/{wvm_id}/e/{eid}/translations"
     url = f"{BASE_URL}{path}"
 
-    headers = HEADERS.copy()
-    headers["Accept"] = "application/json;charset=UTF-8; qs=0.09"
-    headers["Content-Type"] = "application/json;charset=UTF-8; qs=0.09"
-
     # Prepare minimal request body with only required parameters
     body = {
         "formatName": format_upper,
@@ -465,7 +669,7 @@ def export_file(
     if format_upper == "STL":
         res = (resolution or "fine").lower()
         if res not in ("coarse", "medium", "fine", "veryfine"):
-            print(f"Warning: Invalid STL resolution '{res}', defaulting to 'fine'")
+            log(f"Warning: Invalid STL resolution '{res}', defaulting to 'fine'")
             res = "fine"
         body["resolution"] = res
 
@@ -474,8 +678,6 @@ def export_file(
         # Per Onshape API docs, configuration needs to be formatted differently
         # for the asynchronous translation API
         try:
-            import urllib.parse
-
             decoded_config = urllib.parse.unquote(configuration)
 
             # Extract parameter ID and value from the decoded config string
@@ -491,11 +693,11 @@ def export_file(
             else:
                 # If we can't parse correctly, pass as-is
                 body["configuration"] = decoded_config
-                print(f"Warning: Configuration format unexpected: {decoded_config}")
+                log(f"Warning: Configuration format unexpected: {decoded_config}")
         except Exception as e:
             # If processing fails, use as-is
             body["configuration"] = configuration
-            print(f"Warning: Could not process configuration parameter: {e}")
+            log(f"Warning: Could not process configuration parameter: {e}")
 
     # Create the translation job
     try:
@@ -503,115 +705,185 @@ def export_file(
             "POST",
             url,
             json=body,
-            headers=headers,
-            auth=(ACCESS_KEY, SECRET_KEY),
+            headers=ASYNC_HEADERS,
             verbose=verbose,
         )
 
         if r.status_code != 200:
-            print(
+            log(
                 f"❌ Failed to create translation job: {r.status_code} {r.text[:100]}..."
                 if len(r.text) > 100
                 else f"❌ Failed to create translation job: {r.status_code} {r.text}"
             )
             return
     except Exception as e:
-        print(f"❌ Exception during translation job creation: {e}")
+        log(f"❌ Exception during translation job creation: {e}")
         return
 
     # Get translation job details
-    translation_data = r.json()
+    translation_data = json_loads(r.content)
     translation_id = translation_data.get("id")
     request_state = translation_data.get("requestState")
 
-    # 2. Poll until the job is complete
-    max_attempts = 30
+    # 2. Poll until the job is complete. The first check happens right away,
+    # after that back off exponentially unless the server says otherwise.
+    deadline = time.monotonic() + POLL_TIMEOUT
     attempts = 0
+    delay = 0
 
-    while request_state == "ACTIVE" and attempts < max_attempts:
-        print(".", end="", flush=True)
-        time.sleep(2)  # Wait 2 seconds between polls
-        attempts += 1
+    while request_state == "ACTIVE":
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(delay, remaining))
 
         # Check translation status
         status_url = f"{BASE_URL}/api/v6/translations/{translation_id}"
-        r = requests.get(
+        r = SESSION.get(
             status_url,
-            headers={"Accept": "application/json;charset=UTF-8; qs=0.09"},
-            auth=(ACCESS_KEY, SECRET_KEY),
+            headers=ASYNC_HEADERS,
         )
 
         if r.status_code != 200:
-            print(f"\n❌ Failed to check translation status: {r.status_code}")
+            log(f"❌ Failed to check translation status: {r.status_code}")
             return
 
-        translation_data = r.json()
+        translation_data = json_loads(r.content)
         request_state = translation_data.get("requestState")
 
-    # Add newline after progress dots
-    print()
+        delay = retry_after_seconds(r)
+        if delay is None:
+            delay = min(POLL_MAX_DELAY, POLL_BASE_DELAY * POLL_BACKOFF_FACTOR**attempts)
+        attempts += 1
 
     # 3. Check if the translation completed successfully
     if request_state != "DONE":
         if request_state == "FAILED":
             failure_reason = translation_data.get("failureReason", "Unknown failure")
-            print(f"❌ Translation failed: {failure_reason}")
+            log(f"❌ Translation failed for {config_display_name}: {failure_reason}")
         else:
-            print(f"❌ Translation timed out or had unexpected state: {request_state}")
+            log(f"❌ Translation timed out or had unexpected state: {request_state}")
         return
 
     # 4. Download the result
     result_ids = translation_data.get("resultExternalDataIds", [])
 
     if not result_ids:
-        print("❌ No result files available for download")
+        log("❌ No result files available for download")
         return
 
     # Download each result file
     for i, result_id in enumerate(result_ids):
         download_url = f"{BASE_URL}/api/v6/documents/d/{did}/externaldata/{result_id}"
 
-        print(f"Downloading...", end="", flush=True)
-
-        r = requests.get(
+        r = SESSION.get(
             download_url,
-            headers={"Accept": "application/octet-stream"},
-            auth=(ACCESS_KEY, SECRET_KEY),
+            headers=DOWNLOAD_HEADERS,
+            stream=True,
         )
 
         if r.status_code != 200:
-            print(f"\r❌ Failed to download result: {r.status_code}")
+            r.close()
+            log(f"❌ Failed to download result: {r.status_code}")
             continue
 
-        print("\r", end="")  # Clear the downloading message
-
         # Save the file using part studio name if available
-        names = []
-        if part_studio_name:
-            # Clean up the part studio name for use in filenames
-            names.append(part_studio_name)
+        file_index = f"_{i+1}" if len(result_ids) > 1 else ""
+        filename = output_filename(
+            output_dir, part_studio_name, config_display_name, ext, index=file_index
+        )
 
-            # Clean up configuration name
-            if config_display_name and config_display_name != "Default":
-                names.append(config_display_name)
+        save_response(r, filename)
+        log(f"✅ Saved {filename}")
 
-        else:
-            # Fall back to old naming scheme if part studio name not available
-            names.append(config_display_name)
 
-        name = "-".join(slugify(n) for n in names)
-        file_index = f"_{i+1}" if len(result_ids) > 1 else ""
+# Guards the encodings dict shared by export_config calls
+ENCODINGS_LOCK = threading.Lock()
+
+
+def export_config(config, fmt, encodings, overwrite=False, **kwargs):
+    """Export one configuration in one format, picking the right exporter.
+
+    Exports whose output file already exists are skipped unless overwrite is
+    set. Configurations from get_configurations are encoded here, on first
+    use, and the result is kept in encodings for the other formats, so
+    skipped exports don't trigger an encoding request at all.
+    """
+    display_name = config["configurationDisplay"]
+
+    if not overwrite:
+        existing = existing_output(
+            kwargs["output_dir"],
+            kwargs.get("part_studio_name"),
+            display_name,
+            fmt.lower(),
+        )
+        if existing:
+            log(f"⏭  Skipping existing {existing}")
+            return
+
+    query_str = config.get("configurationParametersQuery")
+    if query_str is None:
+        # All formats of a configuration are submitted together, so the
+        # first one to get here encodes it and the others wait for its result
+        key = config["key"]
+        with ENCODINGS_LOCK:
+            future = encodings.get(key)
+            encode_here = future is None
+            if encode_here:
+                future = encodings[key] = Future()
+        if encode_here:
+            try:
+                future.set_result(config["encode"]())
+            except Exception as e:
+                future.set_exception(e)
+        query_str = future.result()
+        if query_str is None:
+            log(f"❌ Failed to encode configuration {display_name}")
+            return
 
-        filename = os.path.join(
-            output_dir, f"{name}{file_index}.{format_upper.lower()}"
+    if fmt.upper() == "STL":
+        export_stl_sync(
+            config_query_str=query_str, config_display_name=display_name, **kwargs
+        )
+    else:
+        export_file(
+            config_query_str=query_str,
+            config_display_name=display_name,
+            format_=fmt,
+            **kwargs,
         )
 
-        with open(filename, "wb") as f:
-            f.write(r.content)
-        print(f"✅ Saved {filename}")
 
+def export_all(configs, formats, max_workers=8, **kwargs):
+    """Export every (configuration, format) pair concurrently.
 
-if __name__ == "__main__":
+    Each export spends nearly all of its time waiting on the Onshape API, so
+    running them on a thread pool overlaps the translation/download latency.
+    """
+    tasks = [(cfg, fmt) for cfg in configs for fmt in formats]
+
+    # {(parameterId, option): Future of its queryParam}, shared by every
+    # format's export
+    encodings = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(export_config, cfg, fmt, encodings, **kwargs): (cfg, fmt)
+            for cfg, fmt in tasks
+        }
+        for future in as_completed(futures):
+            cfg, fmt = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                log(
+                    f"❌ Exception exporting {fmt.upper()} for "
+                    f"{cfg.get('configurationDisplay')}: {e}"
+                )
+
+
+def main():
     parser = argparse.ArgumentParser(description="Export Onshape part configurations.")
     parser.add_argument("url", help="Onshape document URL")
     parser.add_argument("output_dir", help="Directory to save exported files")
@@ -649,27 +921,59 @@ if __name__ == "__main__":
         dest="version_name",
         help="Version name to export (e.g., 'v2.4.5' or '2.4.5'). Overrides the version in the URL.",
     )
+    parser.add_argument(
+        "--overwrite",
+        dest="overwrite",
+        action="store_true",
+        help="Re-export files that already exist in the output directory.",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        dest="clear_cache",
+        action="store_true",
+        help="Discard cached document metadata before exporting.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=8,
+        help="Number of exports to run concurrently (default: 8).",
+    )
     args = parser.parse_args()
 
     if not args.formats:
         parser.error("At least one -f/--format must be specified")
+    if args.jobs < 1:
+        parser.error("-j/--jobs must be at least 1")
+
+    SESSION.auth = load_credentials()
+    # One connection per export worker, plus one for the background part
+    # studio name lookup, so no pooled connection gets discarded
+    mount_adapter(SESSION, args.jobs + 1)
+
+    if args.clear_cache:
+        get_cache().clear()
 
     os.makedirs(args.output_dir, exist_ok=True)
     did, wvm_id, eid, wvm_type = parse_url(args.url, args.version_name)
 
-    # Get the part studio name to use in filenames
-    part_studio_name = get_part_studio_name(
-        did, wvm_id, eid, wvm_type=wvm_type, verbose=args.verbose
+    # Get the part studio name to use in filenames. It's independent of the
+    # configuration lookups below, so fetch it in the background meanwhile.
+    metadata_executor = ThreadPoolExecutor(max_workers=1)
+    part_studio_name_future = metadata_executor.submit(
+        get_part_studio_name, did, wvm_id, eid, wvm_type=wvm_type, verbose=args.verbose
     )
-    # print(f"Part Studio: {part_studio_name}")
 
     # If specific configs are provided via -c, encode and export only those
+    configs = None
     if args.configs:
         # Build parameters list for encoding API
         parameters = []
         for kv in args.configs:
             if "=" not in kv:
-                print(f"Ignoring invalid -c value: {kv} (expected parameterId=value)")
+                log(f"Ignoring invalid -c value: {kv} (expected parameterId=value)")
                 continue
             pid, val = kv.split("=", 1)
             # Convert common literals
@@ -686,25 +990,22 @@ if __name__ == "__main__":
             parameters.append({"parameterId": pid, "parameterValue": param_value})
 
         if not parameters:
-            print("No valid -c configurations provided; falling back to discovered configurations")
+            log("No valid -c configurations provided; falling back to discovered configurations")
         else:
             encode_path = f"/api/v6/elements/d/{did}/e/{eid}/configurationencodings"
             encode_url = f"{BASE_URL}{encode_path}"
-            headers = HEADERS.copy()
             try:
                 r = verbose_request(
                     "POST",
                     encode_url,
-                    headers=headers,
                     json={"parameters": parameters},
-                    auth=(ACCESS_KEY, SECRET_KEY),
                     verbose=args.verbose,
                 )
                 if r.status_code != 200:
-                    print(f"Failed to encode provided configurations: {r.status_code} {r.text}")
+                    log(f"Failed to encode provided configurations: {r.status_code} {r.text}")
                     parameters = []
                 else:
-                    enc = r.json()
+                    enc = json_loads(r.content)
                     query_str = enc.get("queryParam", "")
                     # Display name based on provided overrides
                     disp_parts = []
@@ -716,74 +1017,42 @@ if __name__ == "__main__":
                             v_str = str(v)
                         disp_parts.append(f"{p['parameterId']}={v_str}")
                     display_name = ", ".join(disp_parts) if disp_parts else "Custom"
-                    for fmt in args.formats:
-                        if fmt.upper() == "STL":
-                            export_stl_sync(
-                                did=did,
-                                wvm_id=wvm_id,
-                                eid=eid,
-                                config_query_str=query_str,
-                                config_display_name=display_name,
-                                output_dir=args.output_dir,
-                                part_studio_name=part_studio_name,
-                                resolution=args.resolution,
-                                wvm_type=wvm_type,
-                                verbose=args.verbose,
-                            )
-                        else:
-                            export_file(
-                                did=did,
-                                wvm_id=wvm_id,
-                                eid=eid,
-                                config_query_str=query_str,
-                                config_display_name=display_name,
-                                format_=fmt,
-                                output_dir=args.output_dir,
-                                part_studio_name=part_studio_name,
-                                resolution=args.resolution,
-                                wvm_type=wvm_type,
-                                verbose=args.verbose,
-                            )
-                    # Done, exit main
-                    exit(0)
+                    configs = [
+                        {
+                            "configurationParametersQuery": query_str,
+                            "configurationDisplay": display_name,
+                        }
+                    ]
             except Exception as e:
-                print(f"Error encoding provided configurations: {e}")
+                log(f"Error encoding provided configurations: {e}")
                 parameters = []
 
     # Fall back to discovered configurations
-    configs = get_configurations(
-        did, wvm_id, eid, wvm_type=wvm_type, verbose=args.verbose
+    if configs is None:
+        configs = get_configurations(
+            did, wvm_id, eid, wvm_type=wvm_type, verbose=args.verbose
+        )
+    configs = [c for c in configs if c.get("configurationDisplay")]
+
+    part_studio_name = part_studio_name_future.result()
+    metadata_executor.shutdown()
+    # print(f"Part Studio: {part_studio_name}")
+
+    export_all(
+        configs,
+        args.formats,
+        max_workers=args.jobs,
+        did=did,
+        wvm_id=wvm_id,
+        eid=eid,
+        output_dir=args.output_dir,
+        part_studio_name=part_studio_name,
+        resolution=args.resolution,
+        wvm_type=wvm_type,
+        overwrite=args.overwrite,
+        verbose=args.verbose,
     )
-    for config in configs:
-        query_str = config.get("configurationParametersQuery")
-        display_name = config.get("configurationDisplay")
-        if not display_name:
-            continue
-        for fmt in args.formats:
-            if fmt.upper() == "STL":
-                export_stl_sync(
-                    did=did,
-                    wvm_id=wvm_id,
-                    eid=eid,
-                    config_query_str=query_str,
-                    config_display_name=display_name,
-                    output_dir=args.output_dir,
-                    part_studio_name=part_studio_name,
-                    resolution=args.resolution,
-                    wvm_type=wvm_type,
-                    verbose=args.verbose,
-                )
-            else:
-                export_file(
-                    did=did,
-                    wvm_id=wvm_id,
-                    eid=eid,
-                    config_query_str=query_str,
-                    config_display_name=display_name,
-                    format_=fmt,
-                    output_dir=args.output_dir,
-                    part_studio_name=part_studio_name,
-                    resolution=args.resolution,
-                    wvm_type=wvm_type,
-                    verbose=args.verbose,
-                )
+
+
+if __name__ == "__main__":
+    main()